@@ -1,21 +1,89 @@
 import argparse
+import base64
+import concurrent.futures
+import gzip
+import hashlib
+import http.client
+import io
 import json
 import os
 import re
 import sys
+import threading
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from wiz_control import WizBulb
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used when it is not installed
+    orjson = None
+
+from wiz_control import WizBulb, WizGroup
 
 DEFAULT_REPO = "Pikachuxxxx/Razix"
 DEFAULT_BULB_IP = "192.168.0.120"
 GITHUB_API = "https://api.github.com"
+RECENT_COMMITS = 30
+API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "razix-build-light",
+}
+POOL_MAXSIZE = 8
+MAX_RETRIES = 3
+MAX_REDIRECTS = 10
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 502, 503, 504)
+MAX_RATE_LIMIT_WAIT = 60.0
+# Both accept bytes, so response bodies are parsed without an intermediate str.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+BUILD_COLORS: Dict[str, Tuple[int, int, int, int, str]] = {
+    "success": (0, 220, 80, 80, "green (success)"),
+    "failure": (255, 25, 25, 100, "red (failed)"),
+    "timed_out": (255, 60, 0, 100, "orange-red (timed out)"),
+    "action_required": (255, 90, 0, 100, "orange-red (action required)"),
+    "startup_failure": (255, 0, 60, 100, "crimson (startup failure)"),
+    "cancelled": (90, 90, 255, 55, "blue (cancelled)"),
+    "skipped": (140, 100, 255, 45, "violet (skipped)"),
+    "neutral": (80, 160, 255, 50, "cool blue (neutral)"),
+    "stale": (180, 110, 220, 45, "muted purple (stale)"),
+    "queued": (255, 180, 0, 70, "amber (queued)"),
+    "in_progress": (255, 130, 0, 80, "orange (in progress)"),
+    "waiting": (255, 180, 0, 70, "amber (waiting)"),
+    "requested": (255, 180, 0, 70, "amber (requested)"),
+    "pending": (255, 180, 0, 70, "amber (pending)"),
+    "unknown": (200, 200, 200, 40, "white (unknown)"),
+}
+
+PRESET_COLORS: Dict[str, Tuple[int, int, int, int]] = {
+    "red": (255, 0, 0, 100),
+    "green": (0, 255, 0, 100),
+    "blue": (0, 0, 255, 100),
+    "teal": (20, 190, 170, 55),
+    "dark green": (20, 110, 45, 22),
+}
+# Longest names first so "dark green" wins over its "green" suffix.
+_PRESET_RE = re.compile("|".join(re.escape(n) for n in sorted(PRESET_COLORS, key=len, reverse=True)))
+_RGB_RE = re.compile(r"rgb\s*\(?\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)?")
+
+# Idle keep-alive connections keyed by (scheme, host). Shared across threads so every API call in
+# one CLI invocation reuses the same TCP+TLS session instead of paying a handshake per request.
+_idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+# Conditional-GET cache: {url: [etag, body_path, link]}. 304 responses carry no body and, when
+# authenticated, do not count against the primary rate limit. Anonymous 304s still use up the
+# 60 requests/hour quota, so the cache saves bandwidth there but not rate limit.
+CACHE_DIR = os.path.expanduser("~/.cache/razix-build-light")
+ETAG_INDEX = os.path.join(CACHE_DIR, "etags.json")
+_etag_index: Optional[Dict[str, List[str]]] = None
+_cache_lock = threading.Lock()
 
 
 @dataclass
@@ -40,6 +108,18 @@ class BuildInfo:
         return self.conclusion or "unknown"
 
 
+@dataclass
+class RepoSnapshot:
+    default_branch: str
+    stars: int
+    forks: int
+    watchers: int
+    open_issues: int
+    open_prs: int
+    commit_authors: List[str]
+    last_commit_at: str
+
+
 @dataclass
 class RepoStats:
     repo: str
@@ -60,18 +140,270 @@ class RepoStats:
     vibe: str
 
 
-def _api_get(url: str, token: Optional[str] = None) -> Dict:
-    req = urllib.request.Request(url)
-    req.add_header("Accept", "application/vnd.github+json")
-    req.add_header("User-Agent", "razix-build-light")
+class RateLimiter:
+    """Client-side view of one GitHub rate-limit bucket, refreshed from X-RateLimit-* headers."""
+
+    def __init__(self, max_wait: float = MAX_RATE_LIMIT_WAIT):
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+    def update(self, headers) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self._lock:
+            self.remaining = int(remaining)
+            self.reset_at = float(reset)
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self.remaining is None or self.remaining > 0:
+                if self.remaining is not None:
+                    self.remaining -= 1
+                return
+            wait = self.reset_at - time.time()
+        if wait <= 0:
+            return
+        if wait > self.max_wait:
+            raise RuntimeError(
+                f"GitHub rate limit exhausted; resets in {int(wait)}s. Pass --token or set GITHUB_TOKEN."
+            )
+        time.sleep(wait)
+
+
+# REST and GraphQL are metered separately by GitHub.
+_rate_limits = {"core": RateLimiter(), "graphql": RateLimiter()}
+
+
+def _retry_delay(response: http.client.HTTPResponse, attempt: int) -> Optional[float]:
+    if response.status != 403 and response.status not in RETRY_STATUSES:
+        return None
+    retry_after = response.getheader("Retry-After")
+    if retry_after and retry_after.isdigit():
+        # Same cap as the reset branch: surface a long back-off as an HTTPError instead of hanging.
+        if float(retry_after) <= MAX_RATE_LIMIT_WAIT:
+            return max(float(retry_after), 2.0 ** attempt)
+        return None
+    if response.getheader("X-RateLimit-Remaining") == "0":
+        wait = float(response.getheader("X-RateLimit-Reset") or 0) - time.time()
+        if wait <= MAX_RATE_LIMIT_WAIT:
+            return max(wait, 2.0 ** attempt)
+        return None
+    if response.status in RETRY_STATUSES:
+        # Transient gateway errors: exponential backoff 0.5s, 1s, 2s.
+        return RETRY_BACKOFF * 2.0 ** attempt
+    return None
+
+
+def _acquire_connection(key: Tuple[str, str]) -> http.client.HTTPConnection:
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return idle.pop()
+    scheme, host = key
+    if scheme != "https":
+        return http.client.HTTPConnection(host, timeout=15)
+
+    # Honour HTTPS_PROXY / no_proxy the way urlopen's ProxyHandler did, via a CONNECT tunnel.
+    proxy = urllib.request.getproxies().get("https")
+    hostname = urllib.parse.urlsplit(f"//{host}").hostname or host
+    if not proxy or urllib.request.proxy_bypass(hostname):
+        return http.client.HTTPSConnection(host, timeout=15)
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    proxy_parts = urllib.parse.urlsplit(proxy)
+    tunnel_headers = {}
+    if proxy_parts.username:
+        creds = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    conn = http.client.HTTPSConnection(proxy_parts.hostname, proxy_parts.port or 80, timeout=15)
+    conn.set_tunnel(host, headers=tunnel_headers)
+    return conn
+
+
+def _release_connection(key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+    with _pool_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < POOL_MAXSIZE:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def _load_etag_index() -> Dict[str, List[str]]:
+    global _etag_index
+    if _etag_index is None:
+        try:
+            with open(ETAG_INDEX, "rb") as fh:
+                _etag_index = _json_loads(fh.read())
+        except (OSError, ValueError):
+            _etag_index = {}
+    return _etag_index
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    # Cached bodies can come from authenticated (private repo) requests; keep them owner-only.
+    with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as fh:
+        fh.write(data)
+    os.replace(tmp, path)
+
+
+def _cached_entry(url: str) -> Optional[Tuple[str, str, Optional[str]]]:
+    """Return (etag, body_path, link) for url; the body itself is only read on a 304."""
+    with _cache_lock:
+        entry = _load_etag_index().get(url)
+    if not entry:
+        return None
+    return entry[0], entry[1], entry[2] if len(entry) > 2 else None
+
+
+def _read_cached_body(body_path: str) -> Optional[bytes]:
+    try:
+        with open(body_path, "rb") as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+def _store_response(url: str, etag: str, body: bytes, link: Optional[str]) -> None:
+    body_path = os.path.join(CACHE_DIR, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+    with _cache_lock:
+        index = _load_etag_index()
+        try:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            # makedirs leaves an existing directory's mode alone; tighten caches from older versions.
+            os.chmod(CACHE_DIR, 0o700)
+            _atomic_write(body_path, body)
+            index[url] = [etag, body_path, link]
+            _atomic_write(ETAG_INDEX, json.dumps(index).encode("utf-8"))
+        except OSError:
+            # The cache is an optimisation only; a read-only home directory must not break the CLI.
+            pass
+
+
+def _send_request(
+    key: Tuple[str, str], method: str, target: str, data: Optional[bytes], headers: Dict[str, str]
+) -> Tuple[http.client.HTTPResponse, bytes]:
+    conn = _acquire_connection(key)
+    try:
+        try:
+            conn.request(method, target, body=data, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed an idle keep-alive connection; reconnect once.
+            conn.close()
+            conn.request(method, target, body=data, headers=headers)
+            response = conn.getresponse()
+        body = response.read()
+    except Exception:
+        conn.close()
+        raise
+    if response.getheader("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+
+    if response.will_close:
+        conn.close()
+    else:
+        _release_connection(key, conn)
+    return response, body
+
+
+def _api_call(
+    method: str,
+    url: str,
+    token: Optional[str] = None,
+    payload: Optional[Dict] = None,
+    redirects: int = 0,
+    conditional: bool = True,
+) -> Tuple[Dict, Optional[str]]:
+    """Return the decoded JSON body and the Link header (pagination) of a GitHub API call."""
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    headers = dict(API_HEADERS)
     if token:
-        req.add_header("Authorization", f"Bearer {token}")
-    with urllib.request.urlopen(req, timeout=15) as response:
-        return json.loads(response.read().decode("utf-8"))
+        headers["Authorization"] = f"Bearer {token}"
+    data = None
+    if payload is not None:
+        data = json.dumps(payload).encode("utf-8")
+        headers["Content-Type"] = "application/json"
+    cached = _cached_entry(url) if method == "GET" and conditional else None
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    limiter = _rate_limits["graphql" if parts.path.endswith("/graphql") else "core"]
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.acquire()
+        response, body = _send_request(key, method, target, data, headers)
+        limiter.update(response.headers)
+        delay = _retry_delay(response, attempt)
+        if delay is None or attempt == MAX_RETRIES:
+            break
+        time.sleep(delay)
+
+    if response.status == 304 and cached:
+        cached_body = _read_cached_body(cached[1])
+        if cached_body is not None:
+            return _json_loads(cached_body), response.getheader("Link") or cached[2]
+        # The index outlived its body file; fetch the full response again.
+        return _api_call(method, url, token, payload, redirects, conditional=False)
+    location = response.getheader("Location")
+    if response.status in (301, 302, 307, 308) and location and method == "GET":
+        if redirects >= MAX_REDIRECTS:
+            raise urllib.error.HTTPError(
+                url, response.status, "Too many redirects", response.headers, io.BytesIO(body)
+            )
+        return _api_call(method, urllib.parse.urljoin(url, location), token, redirects=redirects + 1)
+    if response.status >= 400:
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+    etag = response.getheader("ETag")
+    link = response.getheader("Link")
+    if response.status == 200 and etag and method == "GET":
+        _store_response(url, etag, body, link)
+    return _json_loads(body), link
+
+
+def _api_request(method: str, url: str, token: Optional[str] = None, payload: Optional[Dict] = None) -> Dict:
+    return _api_call(method, url, token, payload)[0]
+
+
+def _api_get(url: str, token: Optional[str] = None) -> Dict:
+    return _api_request("GET", url, token)
+
+
+def _last_page(link: Optional[str]) -> Optional[int]:
+    for part in (link or "").split(","):
+        if 'rel="last"' not in part:
+            continue
+        url = part.split(";", 1)[0].strip().strip("<>")
+        page = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get("page")
+        if page and page[0].isdigit():
+            return int(page[0])
+    return None
+
+
+def _graphql(query: str, variables: Dict, token: str) -> Dict:
+    data = _api_request("POST", f"{GITHUB_API}/graphql", token, {"query": query, "variables": variables})
+    if data.get("errors"):
+        messages = "; ".join(str(e.get("message", e)) for e in data["errors"])
+        raise RuntimeError(f"GitHub GraphQL error: {messages}")
+    return data.get("data") or {}
 
 
 def _parse_ts(ts: str) -> datetime:
-    return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    # fromisoformat only understands a trailing "Z" from Python 3.11; spell out the offset instead.
+    return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+
+
+def _to_utc_ts(ts: str) -> str:
+    # GraphQL GitTimestamps keep the author's offset; REST returns UTC "Z". Normalise to the latter.
+    if not ts:
+        return ""
+    return _parse_ts(ts).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
 def get_recent_runs(repo: str, token: Optional[str], per_page: int = 30) -> List[Dict]:
@@ -81,11 +413,19 @@ def get_recent_runs(repo: str, token: Optional[str], per_page: int = 30) -> List
     return data.get("workflow_runs", [])
 
 
-def get_latest_build(repo: str, workflow_filter: Optional[str], token: Optional[str]) -> BuildInfo:
-    runs = get_recent_runs(repo, token, per_page=40)
-    if workflow_filter:
-        needle = workflow_filter.lower()
-        runs = [r for r in runs if needle in str(r.get("name", "")).lower()]
+def _filter_runs(runs: List[Dict], workflow_filter: Optional[str]) -> List[Dict]:
+    if not workflow_filter:
+        return runs
+    needle = workflow_filter.lower()
+    return [r for r in runs if needle in str(r.get("name", "")).lower()]
+
+
+def get_latest_build(
+    repo: str, workflow_filter: Optional[str], token: Optional[str], runs: Optional[List[Dict]] = None
+) -> BuildInfo:
+    if runs is None:
+        runs = get_recent_runs(repo, token, per_page=40)
+    runs = _filter_runs(runs, workflow_filter)
 
     if not runs:
         wf_msg = f" (filter='{workflow_filter}')" if workflow_filter else ""
@@ -109,77 +449,147 @@ def get_latest_build(repo: str, workflow_filter: Optional[str], token: Optional[
 
 
 def color_for_build(build: BuildInfo) -> Tuple[int, int, int, int, str]:
-    key = build.state_key
-    mapping = {
-        "success": (0, 220, 80, 80, "green (success)"),
-        "failure": (255, 25, 25, 100, "red (failed)"),
-        "timed_out": (255, 60, 0, 100, "orange-red (timed out)"),
-        "action_required": (255, 90, 0, 100, "orange-red (action required)"),
-        "startup_failure": (255, 0, 60, 100, "crimson (startup failure)"),
-        "cancelled": (90, 90, 255, 55, "blue (cancelled)"),
-        "skipped": (140, 100, 255, 45, "violet (skipped)"),
-        "neutral": (80, 160, 255, 50, "cool blue (neutral)"),
-        "stale": (180, 110, 220, 45, "muted purple (stale)"),
-        "queued": (255, 180, 0, 70, "amber (queued)"),
-        "in_progress": (255, 130, 0, 80, "orange (in progress)"),
-        "waiting": (255, 180, 0, 70, "amber (waiting)"),
-        "requested": (255, 180, 0, 70, "amber (requested)"),
-        "pending": (255, 180, 0, 70, "amber (pending)"),
-        "unknown": (200, 200, 200, 40, "white (unknown)"),
+    return BUILD_COLORS.get(build.state_key, BUILD_COLORS["unknown"])
+
+
+REPO_SNAPSHOT_QUERY = """
+query($owner: String!, $name: String!, $commits: Int!) {
+  repository(owner: $owner, name: $name) {
+    stargazerCount
+    forkCount
+    watchers { totalCount }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      name
+      target {
+        ... on Commit {
+          history(first: $commits) {
+            nodes { authoredDate author { user { login } } }
+          }
+        }
+      }
     }
-    return mapping.get(key, mapping["unknown"])
-
+  }
+}
+"""
+
+
+def _fetch_snapshot_rest(repo: str, token: Optional[str]) -> RepoSnapshot:
+    # /commits defaults to the repo's default branch, so the three requests are independent and
+    # can be issued together: wall time is the slowest round trip instead of the sum.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as ex:
+        f_repo = ex.submit(_api_get, f"{GITHUB_API}/repos/{repo}", token)
+        f_commits = ex.submit(
+            _api_get,
+            f"{GITHUB_API}/repos/{repo}/commits?{urllib.parse.urlencode({'per_page': RECENT_COMMITS})}",
+            token,
+        )
+        # With per_page=1 the rel="last" page number is the open PR count, at a fraction of the bytes.
+        f_pulls = ex.submit(
+            _api_call,
+            "GET",
+            f"{GITHUB_API}/repos/{repo}/pulls?{urllib.parse.urlencode({'state': 'open', 'per_page': 1})}",
+            token,
+        )
+        repo_data = f_repo.result()
+        commits = f_commits.result()
+        pulls, pulls_link = f_pulls.result()
 
-def build_repo_stats(repo: str, workflow_filter: Optional[str], token: Optional[str]) -> RepoStats:
-    repo_data = _api_get(f"{GITHUB_API}/repos/{repo}", token)
-    default_branch = repo_data.get("default_branch", "main")
-
-    commits = _api_get(
-        f"{GITHUB_API}/repos/{repo}/commits?{urllib.parse.urlencode({'sha': default_branch, 'per_page': 30})}",
-        token,
-    )
     if not isinstance(commits, list):
         commits = []
-
-    pulls = _api_get(
-        f"{GITHUB_API}/repos/{repo}/pulls?{urllib.parse.urlencode({'state': 'open', 'per_page': 100})}",
-        token,
-    )
     if not isinstance(pulls, list):
         pulls = []
 
-    runs = get_recent_runs(repo, token, per_page=40)
-    if workflow_filter:
-        needle = workflow_filter.lower()
-        runs = [r for r in runs if needle in str(r.get("name", "")).lower()]
+    last_commit_at = ""
+    if commits:
+        last_commit_at = ((commits[0].get("commit") or {}).get("author") or {}).get("date", "")
+
+    return RepoSnapshot(
+        default_branch=repo_data.get("default_branch", "main"),
+        stars=int(repo_data.get("stargazers_count", 0)),
+        forks=int(repo_data.get("forks_count", 0)),
+        watchers=int(repo_data.get("subscribers_count", 0)),
+        open_issues=int(repo_data.get("open_issues_count", 0)),
+        open_prs=_last_page(pulls_link) or len(pulls),
+        commit_authors=[(c.get("author") or {}).get("login") or "" for c in commits],
+        last_commit_at=last_commit_at,
+    )
+
+
+def _fetch_snapshot_graphql(repo: str, token: str) -> RepoSnapshot:
+    owner, name = repo.split("/", 1)
+    data = _graphql(REPO_SNAPSHOT_QUERY, {"owner": owner, "name": name, "commits": RECENT_COMMITS}, token)
+    repo_data = data.get("repository")
+    if not repo_data:
+        raise RuntimeError(f"Repository not found: {repo}")
+
+    branch_ref = repo_data.get("defaultBranchRef") or {}
+    history = ((branch_ref.get("target") or {}).get("history") or {}).get("nodes") or []
+    open_prs = int((repo_data.get("pullRequests") or {}).get("totalCount", 0))
+
+    return RepoSnapshot(
+        default_branch=branch_ref.get("name", "main"),
+        stars=int(repo_data.get("stargazerCount", 0)),
+        forks=int(repo_data.get("forkCount", 0)),
+        watchers=int((repo_data.get("watchers") or {}).get("totalCount", 0)),
+        # REST open_issues_count includes open PRs; keep the same meaning so health scores match.
+        open_issues=int((repo_data.get("issues") or {}).get("totalCount", 0)) + open_prs,
+        open_prs=open_prs,
+        commit_authors=[(((n.get("author") or {}).get("user") or {}).get("login") or "") for n in history],
+        last_commit_at=_to_utc_ts(history[0].get("authoredDate", "")) if history else "",
+    )
 
-    completed_runs = [r for r in runs if r.get("status") == "completed"]
-    successes = [r for r in completed_runs if r.get("conclusion") == "success"]
-    success_rate = (len(successes) / len(completed_runs) * 100.0) if completed_runs else 0.0
+
+def fetch_repo_snapshot(repo: str, token: Optional[str]) -> RepoSnapshot:
+    # GraphQL returns everything in one round trip but requires auth; anonymous callers use REST.
+    if token:
+        return _fetch_snapshot_graphql(repo, token)
+    return _fetch_snapshot_rest(repo, token)
+
+
+def _fetch_runs_and_snapshot(repo: str, token: Optional[str]) -> Tuple[List[Dict], RepoSnapshot]:
+    # The two requests are independent, so overlap their round trips.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        f_runs = ex.submit(get_recent_runs, repo, token, 40)
+        f_snapshot = ex.submit(fetch_repo_snapshot, repo, token)
+        return f_runs.result(), f_snapshot.result()
+
+
+def build_repo_stats(
+    repo: str,
+    workflow_filter: Optional[str],
+    token: Optional[str],
+    runs: Optional[List[Dict]] = None,
+    snapshot: Optional[RepoSnapshot] = None,
+) -> RepoStats:
+    if runs is None and snapshot is None:
+        runs, snapshot = _fetch_runs_and_snapshot(repo, token)
+    elif runs is None:
+        runs = get_recent_runs(repo, token, per_page=40)
+    elif snapshot is None:
+        snapshot = fetch_repo_snapshot(repo, token)
+
+    runs = _filter_runs(runs, workflow_filter)
+
+    completed_count = sum(1 for r in runs if r.get("status") == "completed")
+    success_count = sum(1 for r in runs if r.get("status") == "completed" and r.get("conclusion") == "success")
+    success_rate = (success_count / completed_count * 100.0) if completed_count else 0.0
 
     streak = 0
-    for run in completed_runs:
+    for run in runs:
+        if run.get("status") != "completed":
+            continue
         if run.get("conclusion") == "success":
             streak += 1
         else:
             break
 
-    authors = set()
-    last_commit_at = ""
-    for idx, c in enumerate(commits):
-        author = ((c.get("author") or {}).get("login") or "")
-        if author:
-            authors.add(author)
-        if idx == 0:
-            last_commit_at = ((c.get("commit") or {}).get("author") or {}).get("date", "")
-
-    stars = int(repo_data.get("stargazers_count", 0))
-    forks = int(repo_data.get("forks_count", 0))
-    watchers = int(repo_data.get("subscribers_count", 0))
-    open_issues = int(repo_data.get("open_issues_count", 0))
-    open_prs = len(pulls)
-    recent_commits = len(commits)
-    unique_authors = len(authors)
+    stars = snapshot.stars
+    open_issues = snapshot.open_issues
+    open_prs = snapshot.open_prs
+    recent_commits = len(snapshot.commit_authors)
+    unique_authors = len({a for a in snapshot.commit_authors if a})
 
     score = 50
     score += min(int(stars / 50), 15)
@@ -204,17 +614,17 @@ def build_repo_stats(repo: str, workflow_filter: Optional[str], token: Optional[
 
     return RepoStats(
         repo=repo,
-        default_branch=default_branch,
+        default_branch=snapshot.default_branch,
         stars=stars,
-        forks=forks,
-        watchers=watchers,
+        forks=snapshot.forks,
+        watchers=snapshot.watchers,
         open_issues=open_issues,
         open_prs=open_prs,
         recent_commits=recent_commits,
         unique_authors=unique_authors,
-        last_commit_at=last_commit_at,
+        last_commit_at=snapshot.last_commit_at,
         total_recent_runs=len(runs),
-        completed_recent_runs=len(completed_runs),
+        completed_recent_runs=completed_count,
         success_rate=success_rate,
         success_streak=streak,
         health_score=health_score,
@@ -222,6 +632,15 @@ def build_repo_stats(repo: str, workflow_filter: Optional[str], token: Optional[
     )
 
 
+def fetch_build_and_stats(
+    repo: str, workflow_filter: Optional[str], token: Optional[str]
+) -> Tuple[BuildInfo, RepoStats]:
+    runs, snapshot = _fetch_runs_and_snapshot(repo, token)
+    build = get_latest_build(repo, workflow_filter, token, runs=runs)
+    stats = build_repo_stats(repo, workflow_filter, token, runs=runs, snapshot=snapshot)
+    return build, stats
+
+
 def color_for_health(score: int) -> Tuple[int, int, int, int, str]:
     s = max(0, min(score, 100))
     r = int(255 * (100 - s) / 100)
@@ -288,18 +707,28 @@ def print_fun_stats(stats: RepoStats, build: BuildInfo) -> None:
     print(f"Vibe               : {stats.vibe}")
 
 
-def set_light(ip: str, color: Tuple[int, int, int, int, str]) -> None:
+def _apply_color(bulb: WizBulb, color: Tuple[int, int, int, int, str], ack: bool = True) -> None:
     r, g, b, brightness, label = color
-    response = WizBulb(ip).set_color(r, g, b, brightness=brightness)
+    response = bulb.set_color(r, g, b, brightness=brightness, expect_reply=ack)
     print(f"Light set to {label}: rgb=({r},{g},{b}) brightness={brightness}")
-    print(f"Bulb response: {response}")
+    if ack:
+        print(f"Bulb response: {response}")
+
+
+def _open_lights(ips: List[str]) -> WizBulb:
+    return WizBulb(ips[0]) if len(ips) == 1 else WizGroup(ips)
+
+
+def set_light(ips: List[str], color: Tuple[int, int, int, int, str], ack: bool = True) -> None:
+    with _open_lights(ips) as bulb:
+        _apply_color(bulb, color, ack=ack)
 
 
-def set_light_for_build(ip: str, build: BuildInfo) -> None:
-    set_light(ip, color_for_build(build))
+def set_light_for_build(ips: List[str], build: BuildInfo) -> None:
+    set_light(ips, color_for_build(build))
 
 
-def run_fun_lightshow(ip: str, build: BuildInfo, stats: RepoStats, delay: float) -> None:
+def run_fun_lightshow(ips: List[str], build: BuildInfo, stats: RepoStats, delay: float) -> None:
     show = [
         ("build", color_for_build(build)),
         ("health", color_for_health(stats.health_score)),
@@ -308,67 +737,85 @@ def run_fun_lightshow(ip: str, build: BuildInfo, stats: RepoStats, delay: float)
     ]
 
     print("Running Razix build aura lightshow...")
-    for phase, color in show:
-        print(f"Phase: {phase}")
-        set_light(ip, color)
-        time.sleep(delay)
+    with _open_lights(ips) as bulb:
+        for phase, color in show:
+            print(f"Phase: {phase}")
+            # Phase timing is governed by the delay; waiting up to a second for each ack would skew it.
+            _apply_color(bulb, color, ack=False)
+            time.sleep(delay)
 
 
-def run_nl_command(command: str, ip: str, repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
-    text = command.strip().lower()
+def _nl_build_status(hits: Set[str], ips: List[str], repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
+    build = get_latest_build(repo, workflow, token)
+    print_build_summary(build)
+    if {"set", "light"} <= hits:
+        set_light_for_build(ips, build)
 
-    if "last build" in text or "build status" in text:
-        build = get_latest_build(repo, workflow, token)
-        print_build_summary(build)
-        if "set" in text and "light" in text:
-            set_light_for_build(ip, build)
-        return
 
-    if "sync" in text and "build" in text:
-        build = get_latest_build(repo, workflow, token)
-        print_build_summary(build)
-        set_light_for_build(ip, build)
-        return
+def _nl_sync_build(hits: Set[str], ips: List[str], repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
+    build = get_latest_build(repo, workflow, token)
+    print_build_summary(build)
+    set_light_for_build(ips, build)
 
-    if "fun stats" in text or ("stats" in text and "razix" in text):
-        build = get_latest_build(repo, workflow, token)
-        stats = build_repo_stats(repo, workflow, token)
-        print_build_summary(build)
-        print_fun_stats(stats, build)
-        if "light" in text or "show" in text:
-            run_fun_lightshow(ip, build, stats, delay)
-        return
 
-    if "lightshow" in text or "aura" in text or "party" in text:
-        build = get_latest_build(repo, workflow, token)
-        stats = build_repo_stats(repo, workflow, token)
-        run_fun_lightshow(ip, build, stats, delay)
-        return
+def _nl_fun_stats(hits: Set[str], ips: List[str], repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
+    build, stats = fetch_build_and_stats(repo, workflow, token)
+    print_build_summary(build)
+    print_fun_stats(stats, build)
+    if hits & {"light", "show"}:
+        run_fun_lightshow(ips, build, stats, delay)
+
+
+def _nl_lightshow(hits: Set[str], ips: List[str], repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
+    build, stats = fetch_build_and_stats(repo, workflow, token)
+    run_fun_lightshow(ips, build, stats, delay)
+
+
+# Intents in priority order. Each maps to alternative keyword sets; an intent matches when every
+# keyword of any one alternative appears in the command.
+_NL_INTENTS = (
+    (({"last build"}, {"build status"}), _nl_build_status),
+    (({"sync", "build"},), _nl_sync_build),
+    (({"fun stats"}, {"stats", "razix"}), _nl_fun_stats),
+    (({"lightshow"}, {"aura"}, {"party"}), _nl_lightshow),
+)
+_NL_KEYWORDS = frozenset(
+    ["set", "light", "show"] + [kw for alternatives, _ in _NL_INTENTS for alt in alternatives for kw in alt]
+)
+
+
+def run_nl_command(command: str, ips: List[str], repo: str, workflow: Optional[str], token: Optional[str], delay: float) -> None:
+    text = command.strip().lower()
+    # Scan for every keyword once, then route on set membership instead of re-scanning per branch.
+    hits = {kw for kw in _NL_KEYWORDS if kw in text}
+
+    for alternatives, handler in _NL_INTENTS:
+        if any(alt <= hits for alt in alternatives):
+            handler(hits, ips, repo, workflow, token, delay)
+            return
 
     if text in {"on", "turn on", "light on"}:
-        print(WizBulb(ip).set_state(True))
+        with _open_lights(ips) as bulb:
+            print(bulb.set_state(True))
         return
 
     if text in {"off", "turn off", "light off"}:
-        print(WizBulb(ip).set_state(False))
+        with _open_lights(ips) as bulb:
+            print(bulb.set_state(False))
         return
 
-    presets = {
-        "red": (255, 0, 0, 100),
-        "green": (0, 255, 0, 100),
-        "blue": (0, 0, 255, 100),
-        "teal": (20, 190, 170, 55),
-        "dark green": (20, 110, 45, 22),
-    }
-    for name, (r, g, b, bright) in presets.items():
-        if name in text:
-            print(WizBulb(ip).set_color(r, g, b, brightness=bright))
-            return
+    preset = _PRESET_RE.search(text)
+    if preset:
+        r, g, b, bright = PRESET_COLORS[preset.group(0)]
+        with _open_lights(ips) as bulb:
+            print(bulb.set_color(r, g, b, brightness=bright))
+        return
 
-    rgb = re.search(r"rgb\s*\(?\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)?", text)
+    rgb = _RGB_RE.search(text)
     if rgb:
         r, g, b = map(int, rgb.groups())
-        print(WizBulb(ip).set_color(r, g, b, brightness=80))
+        with _open_lights(ips) as bulb:
+            print(bulb.set_color(r, g, b, brightness=80))
         return
 
     raise RuntimeError(
@@ -377,13 +824,15 @@ def run_nl_command(command: str, ip: str, repo: str, workflow: Optional[str], to
     )
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
+    # Fixed prog: run_razix_intent.py calls main() in-process, where sys.argv[0] names the wrapper.
     parser = argparse.ArgumentParser(
-        description="Check GitHub Actions build status, compute fun repo stats, and control a WiZ bulb"
+        prog="razix_build_light.py",
+        description="Check GitHub Actions build status, compute fun repo stats, and control a WiZ bulb",
     )
     parser.add_argument("--repo", default=DEFAULT_REPO, help="GitHub repo in owner/name format")
     parser.add_argument("--workflow", help="Optional workflow name filter (substring match)")
-    parser.add_argument("--ip", default=DEFAULT_BULB_IP, help="WiZ bulb IP")
+    parser.add_argument("--ip", default=DEFAULT_BULB_IP, help="WiZ bulb IP (comma-separated for several bulbs)")
     parser.add_argument("--token", default=os.getenv("GITHUB_TOKEN"), help="GitHub token (optional)")
 
     parser.add_argument("--status", action="store_true", help="Print latest build status")
@@ -394,18 +843,30 @@ def main() -> int:
     parser.add_argument("--json", action="store_true", help="Print machine-readable JSON payload")
     parser.add_argument("--command", help="Natural language command for AI/web wrappers")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not (args.status or args.set_light or args.fun_stats or args.fun_lightshow or args.command):
         parser.error("Provide one of --status, --set-light, --fun-stats, --fun-lightshow, or --command")
 
+    ips = [ip.strip() for ip in args.ip.split(",") if ip.strip()]
+    if not ips:
+        parser.error("--ip needs at least one bulb address")
+
     try:
         if args.command:
-            run_nl_command(args.command, args.ip, args.repo, args.workflow, args.token, args.delay)
+            run_nl_command(args.command, ips, args.repo, args.workflow, args.token, args.delay)
+            return 0
+
+        if not (args.fun_stats or args.fun_lightshow or args.json):
+            # --status / --set-light only need the latest run; skip the repo stats requests for them.
+            build = get_latest_build(args.repo, args.workflow, args.token)
+            if args.status:
+                print_build_summary(build)
+            if args.set_light:
+                set_light_for_build(ips, build)
             return 0
 
-        build = get_latest_build(args.repo, args.workflow, args.token)
-        stats = build_repo_stats(args.repo, args.workflow, args.token)
+        build, stats = fetch_build_and_stats(args.repo, args.workflow, args.token)
 
         if args.status:
             print_build_summary(build)
@@ -414,10 +875,10 @@ def main() -> int:
             print_fun_stats(stats, build)
 
         if args.set_light:
-            set_light_for_build(args.ip, build)
+            set_light_for_build(ips, build)
 
         if args.fun_lightshow:
-            run_fun_lightshow(args.ip, build, stats, args.delay)
+            run_fun_lightshow(ips, build, stats, args.delay)
 
         if args.json:
             payload = {
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import argparse
+import importlib.util
 import shlex
-import subprocess
 import sys
 from pathlib import Path
 
@@ -28,6 +28,16 @@ def build_args_from_intent(intent: str) -> list[str]:
     return ["--command", intent]
 
 
+def load_script(script_path: Path):
+    # Import in-process instead of spawning a second interpreter; the script's directory goes on
+    # sys.path so its `from wiz_control import WizBulb` resolves.
+    sys.path.insert(0, str(script_path.parent))
+    spec = importlib.util.spec_from_file_location("razix_build_light", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def main() -> int:
     default_script = Path(__file__).resolve().parent / "razix_build_light.py"
     parser = argparse.ArgumentParser(
@@ -41,7 +51,7 @@ def main() -> int:
     )
     parser.add_argument("--repo", help="GitHub repo override: owner/name")
     parser.add_argument("--workflow", help="Workflow name filter")
-    parser.add_argument("--ip", help="WiZ bulb IP override")
+    parser.add_argument("--ip", help="WiZ bulb IP override (comma-separated for several bulbs)")
     parser.add_argument("--token", help="GitHub token override")
     parser.add_argument("--delay", type=float, help="Lightshow phase delay seconds")
     parser.add_argument("--json", action="store_true", help="Append --json")
@@ -53,8 +63,7 @@ def main() -> int:
         print(f"Error: script not found: {script_path}", file=sys.stderr)
         return 2
 
-    cmd = [sys.executable, str(script_path)]
-    cmd.extend(build_args_from_intent(args.intent))
+    cmd = build_args_from_intent(args.intent)
 
     if args.repo:
         cmd.extend(["--repo", args.repo])
@@ -69,13 +78,12 @@ def main() -> int:
     if args.json:
         cmd.append("--json")
 
-    print("Executing:", shlex.join(cmd))
+    print("Executing:", shlex.join([sys.executable, str(script_path), *cmd]))
 
     if args.dry_run:
         return 0
 
-    result = subprocess.run(cmd)
-    return result.returncode
+    return load_script(script_path).main(cmd)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,19 @@
 import argparse
-import concurrent.futures
 import ipaddress
 import json
+import selectors
 import socket
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used when it is not installed
+    orjson = None
+
 DEFAULT_PORT = 38899
+# Both accept bytes, so datagrams are parsed without an intermediate str.
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 
 class WizBulb:
@@ -14,30 +21,108 @@ class WizBulb:
         self.ip = ip
         self.port = port
         self.timeout = timeout
+        # One socket for the bulb's lifetime instead of socket/close per command.
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.settimeout(timeout)
+        # Set after a fire-and-forget command whose ack may still arrive on the socket.
+        self._unacked = False
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def __enter__(self) -> "WizBulb":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        sock = getattr(self, "_sock", None)
+        if sock is not None:
+            sock.close()
+
+    def _drain(self) -> None:
+        # Acks for earlier fire-and-forget commands may still be queued; drop them so they are
+        # not mistaken for the reply to the next command.
+        self._unacked = False
+        self._sock.setblocking(False)
+        try:
+            while True:
+                self._sock.recvfrom(4096)
+        except OSError:
+            pass
+        finally:
+            self._sock.settimeout(self.timeout)
 
     def send(self, cmd: Dict[str, Any], expect_reply: bool = True) -> Optional[Dict[str, Any]]:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.settimeout(self.timeout)
-            sock.sendto(json.dumps(cmd).encode("utf-8"), (self.ip, self.port))
-            if not expect_reply:
-                return None
-            data, _ = sock.recvfrom(4096)
-            return json.loads(data.decode("utf-8"))
+        if expect_reply and self._unacked:
+            self._drain()
+        self._sock.sendto(json.dumps(cmd).encode("utf-8"), (self.ip, self.port))
+        if not expect_reply:
+            self._unacked = True
+            return None
+        data, _ = self._sock.recvfrom(4096)
+        return _json_loads(data)
 
     def get_status(self) -> Dict[str, Any]:
         return self.send({"method": "getPilot", "params": {}}) or {}
 
-    def set_state(self, on: bool) -> Dict[str, Any]:
-        return self.send({"method": "setPilot", "params": {"state": on}}) or {}
+    def set_state(self, on: bool, expect_reply: bool = True) -> Dict[str, Any]:
+        return self.send({"method": "setPilot", "params": {"state": on}}, expect_reply=expect_reply) or {}
 
-    def set_color(self, r: int, g: int, b: int, brightness: Optional[int] = None) -> Dict[str, Any]:
+    def set_color(
+        self, r: int, g: int, b: int, brightness: Optional[int] = None, expect_reply: bool = True
+    ) -> Dict[str, Any]:
         params: Dict[str, Any] = {"state": True, "r": int(r), "g": int(g), "b": int(b)}
         if brightness is not None:
             params["dimming"] = int(brightness)
-        return self.send({"method": "setPilot", "params": params}) or {}
+        return self.send({"method": "setPilot", "params": params}, expect_reply=expect_reply) or {}
+
+    def set_brightness(self, brightness: int, expect_reply: bool = True) -> Dict[str, Any]:
+        return self.send({"method": "setPilot", "params": {"dimming": int(brightness)}}, expect_reply=expect_reply) or {}
 
-    def set_brightness(self, brightness: int) -> Dict[str, Any]:
-        return self.send({"method": "setPilot", "params": {"dimming": int(brightness)}}) or {}
+
+class WizGroup(WizBulb):
+    """Drive several bulbs as one: each command goes to every IP over a single socket."""
+
+    def __init__(self, ips: List[str], port: int = DEFAULT_PORT, timeout: float = 1.0):
+        # Replies are matched by source address, so hostnames are resolved and duplicates dropped
+        # up front; otherwise acks would never match and the full timeout would always be spent.
+        resolved = list(dict.fromkeys(socket.gethostbyname(ip) for ip in ips))
+        super().__init__(resolved[0] if resolved else "", port=port, timeout=timeout)
+        self.ips = resolved
+
+    def send(self, cmd: Dict[str, Any], expect_reply: bool = True) -> Optional[Dict[str, Any]]:
+        if expect_reply and self._unacked:
+            self._drain()
+        payload = json.dumps(cmd).encode("utf-8")
+        for ip in self.ips:
+            self._sock.sendto(payload, (ip, self.port))
+        if not expect_reply:
+            self._unacked = True
+            return None
+
+        # Acks are collected as they arrive, so N bulbs cost one timeout window rather than N.
+        replies: Dict[str, Any] = {}
+        deadline = time.monotonic() + self.timeout
+        try:
+            while len(replies) < len(self.ips):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._sock.settimeout(remaining)
+                try:
+                    data, (addr, _) = self._sock.recvfrom(4096)
+                except socket.timeout:
+                    break
+                if addr in self.ips:
+                    replies[addr] = _json_loads(data)
+        finally:
+            self._sock.settimeout(self.timeout)
+        if not replies:
+            # Match WizBulb.send, which raises when its single bulb does not answer.
+            raise socket.timeout(f"No reply from any bulb: {', '.join(self.ips)}")
+        return replies
 
 
 def local_ip() -> str:
@@ -54,47 +139,81 @@ def discover_wiz(subnet: Optional[str] = None, timeout: float = 0.3) -> List[Tup
         net = ipaddress.ip_network(subnet, strict=False)
 
     probe_msg = json.dumps({"method": "getPilot", "params": {}}).encode("utf-8")
-
-    def probe(target_ip: str):
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-            s.settimeout(timeout)
-            try:
-                s.sendto(probe_msg, (target_ip, DEFAULT_PORT))
-                data, _ = s.recvfrom(4096)
-                payload = json.loads(data.decode("utf-8"))
-                return target_ip, payload
-            except Exception:
-                return None
-
-    hosts = [str(h) for h in net.hosts()]
-    found: List[Tuple[str, Dict[str, Any]]] = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=128) as ex:
-        for result in ex.map(probe, hosts):
-            if result:
-                found.append(result)
-    return found
+    hosts = {str(h) for h in net.hosts()}
+    replies: Dict[str, Dict[str, Any]] = {}
+
+    # One non-blocking socket for the whole sweep: fire every probe, then collect replies until
+    # the deadline. The sweep takes ~timeout seconds regardless of subnet size. The selector is
+    # epoll/kqueue where available, so each wakeup costs the same for a /24 as for a /16.
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock, selectors.DefaultSelector() as sel:
+        sock.setblocking(False)
+        sel.register(sock, selectors.EVENT_READ)
+
+        def drain() -> None:
+            while True:
+                try:
+                    data, (addr, _) = sock.recvfrom(4096)
+                except (BlockingIOError, InterruptedError):
+                    return
+                except OSError:
+                    continue
+                if addr not in hosts or addr in replies:
+                    continue
+                try:
+                    replies[addr] = _json_loads(data)
+                except ValueError:
+                    continue
+
+        for target_ip in hosts:
+            # Send buffer full (large subnets): keep waiting for room until the probe goes out,
+            # draining early replies meanwhile so they do not overflow the receive buffer.
+            send_deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    sock.sendto(probe_msg, (target_ip, DEFAULT_PORT))
+                    break
+                except BlockingIOError:
+                    remaining = send_deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    sel.modify(sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                    sel.select(remaining)
+                    sel.modify(sock, selectors.EVENT_READ)
+                    drain()
+                except OSError:
+                    break
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if sel.select(remaining):
+                drain()
+
+    return sorted(replies.items(), key=lambda item: ipaddress.ip_address(item[0]))
 
 
 def run_demo(ip: str):
-    bulb = WizBulb(ip)
-    print("Using bulb:", ip)
+    with WizBulb(ip) as bulb:
+        print("Using bulb:", ip)
 
-    print("Status:", bulb.get_status())
+        print("Status:", bulb.get_status())
 
-    print("Turn ON")
-    print(bulb.set_state(True))
-    time.sleep(1)
+        print("Turn ON")
+        print(bulb.set_state(True))
+        time.sleep(1)
 
-    print("Set RED")
-    print(bulb.set_color(255, 0, 0))
-    time.sleep(1)
+        print("Set RED")
+        print(bulb.set_color(255, 0, 0))
+        time.sleep(1)
 
-    print("Set brightness 25%")
-    print(bulb.set_brightness(25))
-    time.sleep(1)
+        print("Set brightness 25%")
+        print(bulb.set_brightness(25))
+        time.sleep(1)
 
-    print("Turn OFF")
-    print(bulb.set_state(False))
+        print("Turn OFF")
+        print(bulb.set_state(False))
 
 
 if __name__ == "__main__":
@@ -115,5 +234,5 @@ if __name__ == "__main__":
     else:
         if not args.ip:
             raise SystemExit("Provide --ip, or use --discover")
-        bulb = WizBulb(args.ip)
-        print(json.dumps(bulb.get_status(), indent=2))
+        with WizBulb(args.ip) as bulb:
+            print(json.dumps(bulb.get_status(), indent=2))